@@ -6,7 +6,18 @@ Handles icon generation, PyInstaller, code signing (macOS), DMG creation,
 and Inno Setup invocation (Windows).
 
 Usage:
-  python installer/launcher/build-launcher/build.py [--version VERSION]
+  python installer/launcher/build-launcher/build.py [--version VERSION] [--fresh]
+      [--work-cache] [--print-cache-key]
+
+Builds are incremental: PyInstaller's workpath (build/launcher/) is kept
+between runs so Analysis/PYZ artifacts are reused, and PyInstaller is
+skipped entirely when the spec and launcher sources are unchanged. Pass
+--fresh (or delete build/launcher/) if the cache ever goes stale.
+
+With --work-cache the workpath is also archived to .cache/launcher-<key>.tar
+after each PyInstaller run and restored from there when build/launcher/ is
+missing, so CI can persist it between jobs. --print-cache-key prints <key>
+for use as the CI cache key (see .github/workflows/build-launcher.yml).
 
 Requirements:
   pip install pyinstaller pystray Pillow
@@ -15,11 +26,15 @@ Requirements:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import importlib.metadata
+import importlib.util
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import tarfile
 import tempfile
 from pathlib import Path
 
@@ -27,25 +42,112 @@ ROOT = Path(__file__).parent.parent.parent.parent  # repo root
 BUILD_DIR = Path(__file__).parent  # build-launcher/
 SPEC_FILE = BUILD_DIR / "launcher.spec"
 ASSETS_DIR = BUILD_DIR.parent / "assets"
+LAUNCHER_DIR = BUILD_DIR.parent  # installer/launcher/
 DIST_DIR = ROOT / "dist" / "launcher"
+WORK_DIR = ROOT / "build" / "launcher"
+HASH_FILE = WORK_DIR / ".last_hash"
+CACHE_DIR = ROOT / ".cache"
+
+
+# (import name, pip package) for each build dependency
+BUILD_DEPS = (("PyInstaller", "pyinstaller"), ("pystray", "pystray"), ("PIL", "Pillow"))
+
+_DEPS_OK = False
 
 
 def check_deps() -> bool:
-    """Verify build dependencies are installed."""
-    missing = []
-    for pkg in ("PyInstaller", "pystray", "PIL"):
-        try:
-            __import__(pkg)
-        except ImportError:
-            missing.append(pkg.lower() if pkg != "PIL" else "Pillow")
+    """Verify build dependencies are installed.
+
+    Uses find_spec so the packages are located without being imported.
+    """
+    global _DEPS_OK
+    if _DEPS_OK:
+        return True
+
+    missing = [pip for mod, pip in BUILD_DEPS if importlib.util.find_spec(mod) is None]
 
     if missing:
         print(f"Missing build dependencies: {', '.join(missing)}")
         print(f"Run: pip install {' '.join(missing)}")
         return False
+
+    _DEPS_OK = True
     return True
 
 
+def toolchain_id() -> str:
+    """Python build, platform and build dependency versions, one per line."""
+    lines = [sys.version, f"{platform.system()}-{platform.machine()}"]
+    lines += [f"{pip}=={importlib.metadata.version(pip)}" for _, pip in BUILD_DEPS]
+    return "\n".join(lines)
+
+
+def source_hash(version: str) -> str:
+    """Fingerprint the spec, launcher sources, assets, version and build toolchain."""
+    digest = hashlib.sha256(version.encode())
+    digest.update(toolchain_id().encode())
+    assets = sorted(p for p in ASSETS_DIR.rglob("*") if p.is_file())
+    sources = sorted(LAUNCHER_DIR.rglob("*.py")) + assets
+    for path in [SPEC_FILE, *sources]:
+        digest.update(str(path.relative_to(LAUNCHER_DIR)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def dist_artifact() -> Path:
+    """Path of the app PyInstaller produces for the current platform."""
+    if platform.system() == "Darwin":
+        return DIST_DIR / "PocketPaw.app"
+    if platform.system() == "Windows":
+        return DIST_DIR / "PocketPaw" / "PocketPaw.exe"
+    return DIST_DIR / "PocketPaw" / "PocketPaw"
+
+
+def cache_key() -> str:
+    """Key for the workpath archive: spec file and build toolchain."""
+    digest = hashlib.sha256(SPEC_FILE.read_bytes())
+    digest.update(toolchain_id().encode())
+    return digest.hexdigest()[:16]
+
+
+def restore_work_cache(key: str) -> bool:
+    """Unpack a cached PyInstaller workpath, if one exists for this key."""
+    archive = CACHE_DIR / f"launcher-{key}.tar"
+    if not archive.exists():
+        return False
+
+    print(f"Restoring PyInstaller work cache: {archive}")
+    WORK_DIR.mkdir(parents=True, exist_ok=True)
+    with tarfile.open(archive) as tar:
+        # Extraction filters landed in 3.12 and were backported to 3.11.4
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(WORK_DIR, filter="data")
+        else:
+            tar.extractall(WORK_DIR)
+    return True
+
+
+def save_work_cache(key: str) -> None:
+    """Archive the PyInstaller workpath, replacing archives for older keys."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in CACHE_DIR.glob("launcher-*.tar"):
+        stale.unlink()
+
+    archive = CACHE_DIR / f"launcher-{key}.tar"
+    with tarfile.open(archive, "w") as tar:
+        tar.add(WORK_DIR, arcname=".")
+    print(f"Saved PyInstaller work cache: {archive}")
+
+
+def list_dir(path: Path) -> dict[str, os.DirEntry]:
+    """Map entry names to DirEntry objects with a single scandir (empty if missing)."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return {}
+
+
 def ensure_icons() -> None:
     """Generate .ico/.icns if they don't exist."""
     ico = ASSETS_DIR / "icon.ico"
@@ -198,7 +300,7 @@ def run_inno_setup(iss_path: Path, version: str) -> bool:
     return False
 
 
-def build(version: str) -> int:
+def build(version: str, fresh: bool = False, work_cache: bool = False) -> int:
     """Run the full build pipeline."""
     if not check_deps():
         return 1
@@ -214,38 +316,61 @@ def build(version: str) -> int:
     # Step 1: Generate icons if missing
     ensure_icons()
 
-    # Step 2: Clean previous build
-    build_work = ROOT / "build" / "launcher"
-    if build_work.exists():
-        shutil.rmtree(build_work)
+    # Step 2: Only wipe the PyInstaller workpath when asked to, otherwise
+    # seed it from the archived cache when it's missing (e.g. fresh CI runner)
+    key = cache_key()
+    if fresh:
+        if WORK_DIR.exists():
+            shutil.rmtree(WORK_DIR)
+    elif work_cache and not WORK_DIR.exists():
+        restore_work_cache(key)
+
+    # Step 3: Run PyInstaller (skipped when nothing changed since the last build)
+    fingerprint = source_hash(version)
+    up_to_date = (
+        not fresh
+        and dist_artifact().exists()
+        and HASH_FILE.exists()
+        and HASH_FILE.read_text().strip() == fingerprint
+    )
 
-    # Step 3: Run PyInstaller
-    cmd = [
-        sys.executable,
-        "-m",
-        "PyInstaller",
-        str(SPEC_FILE),
-        "--distpath",
-        str(DIST_DIR),
-        "--workpath",
-        str(build_work),
-        "--clean",
-        "--noconfirm",
-    ]
+    if up_to_date:
+        print("Launcher sources unchanged since last build, skipping PyInstaller")
+    else:
+        cmd = [
+            sys.executable,
+            "-m",
+            "PyInstaller",
+            str(SPEC_FILE),
+            "--distpath",
+            str(DIST_DIR),
+            "--workpath",
+            str(WORK_DIR),
+            "--noconfirm",
+        ]
 
-    print(f"Running: {' '.join(cmd)}\n")
-    result = subprocess.run(cmd, cwd=str(ROOT))
+        print(f"Running: {' '.join(cmd)}\n")
+        # Forget the last fingerprint so a failed run can't leave it paired
+        # with a half-replaced dist/
+        HASH_FILE.unlink(missing_ok=True)
+        result = subprocess.run(cmd, cwd=str(ROOT))
 
-    if result.returncode != 0:
-        print("\nBuild failed!")
-        return result.returncode
+        if result.returncode != 0:
+            print("\nBuild failed!")
+            return result.returncode
 
-    print("\nPyInstaller build successful!")
+        HASH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        HASH_FILE.write_text(fingerprint)
+        print("\nPyInstaller build successful!")
+        if work_cache:
+            save_work_cache(key)
 
     # Step 4: Platform-specific post-processing
+    dist_entries = list_dir(DIST_DIR)
+
     if platform.system() == "Darwin":
-        app_path = DIST_DIR / "PocketPaw.app"
-        if app_path.exists():
+        if "PocketPaw.app" in dist_entries:
+            app_path = DIST_DIR / "PocketPaw.app"
             print(f"macOS app: {app_path}")
 
             # Code sign
@@ -256,8 +381,8 @@ def build(version: str) -> int:
             create_dmg(app_path, dmg_path)
 
     elif platform.system() == "Windows":
-        exe_path = DIST_DIR / "PocketPaw" / "PocketPaw.exe"
-        if exe_path.exists():
+        if "PocketPaw" in dist_entries and "PocketPaw.exe" in list_dir(DIST_DIR / "PocketPaw"):
+            exe_path = DIST_DIR / "PocketPaw" / "PocketPaw.exe"
             print(f"Windows exe: {exe_path}")
 
             # Try Inno Setup
@@ -275,8 +400,26 @@ def main() -> int:
         default=os.environ.get("POCKETPAW_VERSION", "0.1.0"),
         help="Version string to embed (default: $POCKETPAW_VERSION or 0.1.0)",
     )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Discard the PyInstaller work cache and rebuild from scratch",
+    )
+    parser.add_argument(
+        "--work-cache",
+        action="store_true",
+        help="Restore/save the PyInstaller workpath as an archive under .cache/",
+    )
+    parser.add_argument(
+        "--print-cache-key",
+        action="store_true",
+        help="Print the work cache archive key and exit",
+    )
     args = parser.parse_args()
-    return build(args.version)
+    if args.print_cache_key:
+        print(cache_key())
+        return 0
+    return build(args.version, fresh=args.fresh, work_cache=args.work_cache)
 
 
 if __name__ == "__main__":
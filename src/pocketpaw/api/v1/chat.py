@@ -25,6 +25,12 @@ router = APIRouter(tags=["Chat"], dependencies=[Depends(require_scope("chat"))])
 _active_streams: dict[str, asyncio.Event] = {}
 
 
+def _sse(event: str, data: dict) -> str:
+    """Format one SSE event. Non-ASCII text is sent as UTF-8, not \\u escapes."""
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
 class _APISessionBridge:
     """Bridges the message bus to an asyncio.Queue for SSE streaming.
 
@@ -179,7 +185,7 @@ async def chat_stream(body: ChatRequest):
     async def _event_generator():
         try:
             # Initial event
-            yield f"event: stream_start\ndata: {json.dumps({'session_id': chat_id})}\n\n"
+            yield _sse("stream_start", {"session_id": chat_id})
 
             while not cancel_event.is_set():
                 try:
@@ -187,7 +193,7 @@ async def chat_stream(body: ChatRequest):
                 except TimeoutError:
                     continue
 
-                yield f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+                yield _sse(event["event"], event["data"])
 
                 if event["event"] in ("stream_end", "error"):
                     break
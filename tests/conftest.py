@@ -1,7 +1,5 @@
 """Pytest configuration."""
 
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -2,6 +2,7 @@
 # Created: 2026-02-20
 
 import asyncio
+from collections import deque
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -11,16 +12,27 @@ from fastapi.testclient import TestClient
 from pocketpaw.api.v1.chat import _APISessionBridge, _active_streams, router
 
 
-@pytest.fixture
+class _EventQueue:
+    """Pre-loaded stand-in for the bridge's asyncio.Queue (no loop bookkeeping)."""
+
+    def __init__(self, *events):
+        self.events = deque(events)
+
+    async def get(self):
+        return self.events.popleft()
+
+
+@pytest.fixture(scope="module")
 def test_app():
     app = FastAPI()
     app.include_router(router, prefix="/api/v1")
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(test_app):
-    return TestClient(test_app)
+    with TestClient(test_app) as c:
+        yield c
 
 
 class TestAPISessionBridge:
@@ -49,20 +61,17 @@ class TestChatStream:
     def test_stream_returns_sse(self, mock_bridge_cls, mock_send, client):
         # Set up mock bridge
         bridge = MagicMock()
-        q = asyncio.Queue()
-        bridge.queue = q
         bridge.start = AsyncMock()
         bridge.stop = AsyncMock()
         mock_bridge_cls.return_value = bridge
         mock_send.return_value = "api:test123"
 
         # Pre-load events into the queue
-        async def _load():
-            await q.put({"event": "chunk", "data": {"content": "Hello "}})
-            await q.put({"event": "chunk", "data": {"content": "world"}})
-            await q.put({"event": "stream_end", "data": {"session_id": "api:test123", "usage": {}}})
-
-        asyncio.get_event_loop().run_until_complete(_load())
+        bridge.queue = _EventQueue(
+            {"event": "chunk", "data": {"content": "Hello "}},
+            {"event": "chunk", "data": {"content": "world"}},
+            {"event": "stream_end", "data": {"session_id": "api:test123", "usage": {}}},
+        )
 
         with client.stream(
             "POST",
@@ -88,16 +97,13 @@ class TestChatStop:
         resp = client.post("/api/v1/chat/stop?session_id=nonexistent")
         assert resp.status_code == 404
 
-    def test_stop_active_stream(self, client):
+    def test_stop_active_stream(self, client, monkeypatch):
         event = asyncio.Event()
-        _active_streams["test-sess"] = event
-        try:
-            resp = client.post("/api/v1/chat/stop?session_id=test-sess")
-            assert resp.status_code == 200
-            assert resp.json()["status"] == "ok"
-            assert event.is_set()
-        finally:
-            _active_streams.pop("test-sess", None)
+        monkeypatch.setitem(_active_streams, "test-sess", event)
+        resp = client.post("/api/v1/chat/stop?session_id=test-sess")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "ok"
+        assert event.is_set()
 
 
 class TestChatSend:
@@ -107,8 +113,6 @@ class TestChatSend:
     @patch("pocketpaw.api.v1.chat._APISessionBridge")
     def test_send_returns_complete_response(self, mock_bridge_cls, mock_send, client):
         bridge = MagicMock()
-        q = asyncio.Queue()
-        bridge.queue = q
         bridge.chat_id = "api:test"
         bridge.start = AsyncMock()
         bridge.stop = AsyncMock()
@@ -116,12 +120,11 @@ class TestChatSend:
         mock_send.return_value = "api:test"
 
         # Load events
-        async def _load():
-            await q.put({"event": "chunk", "data": {"content": "Hello "}})
-            await q.put({"event": "chunk", "data": {"content": "world!"}})
-            await q.put({"event": "stream_end", "data": {"session_id": "api:test", "usage": {"tokens": 10}}})
-
-        asyncio.get_event_loop().run_until_complete(_load())
+        bridge.queue = _EventQueue(
+            {"event": "chunk", "data": {"content": "Hello "}},
+            {"event": "chunk", "data": {"content": "world!"}},
+            {"event": "stream_end", "data": {"session_id": "api:test", "usage": {"tokens": 10}}},
+        )
 
         resp = client.post("/api/v1/chat", json={"content": "Hi"})
         assert resp.status_code == 200
@@ -144,20 +147,15 @@ class TestSSEFormat:
         import json as _json
 
         bridge = MagicMock()
-        q = asyncio.Queue()
-        bridge.queue = q
         bridge.start = AsyncMock()
         bridge.stop = AsyncMock()
         mock_bridge_cls.return_value = bridge
         mock_send.return_value = "api:sse-test"
 
-        async def _load():
-            await q.put({"event": "chunk", "data": {"content": "hi"}})
-            await q.put(
-                {"event": "stream_end", "data": {"session_id": "api:sse-test", "usage": {}}}
-            )
-
-        asyncio.get_event_loop().run_until_complete(_load())
+        bridge.queue = _EventQueue(
+            {"event": "chunk", "data": {"content": "hi"}},
+            {"event": "stream_end", "data": {"session_id": "api:sse-test", "usage": {}}},
+        )
 
         with client.stream(
             "POST", "/api/v1/chat/stream", json={"content": "test"}
@@ -170,16 +168,34 @@ class TestSSEFormat:
         assert len(events) >= 2, f"Expected at least 2 SSE events, got {len(events)}: {raw!r}"
 
         for event_block in events:
-            lines = event_block.split("\n")
-            event_line = next((l for l in lines if l.startswith("event:")), None)
-            data_line = next((l for l in lines if l.startswith("data:")), None)
+            fields = dict(ln.split(":", 1) for ln in event_block.split("\n") if ":" in ln)
 
-            assert event_line is not None, f"Missing 'event:' line in SSE block: {event_block!r}"
-            assert data_line is not None, f"Missing 'data:' line in SSE block: {event_block!r}"
+            assert "event" in fields, f"Missing 'event:' line in SSE block: {event_block!r}"
+            assert "data" in fields, f"Missing 'data:' line in SSE block: {event_block!r}"
 
-            event_type = event_line.split(":", 1)[1].strip()
+            event_type = fields["event"].strip()
             assert event_type, f"Empty event type in: {event_block!r}"
 
-            data_str = data_line.split(":", 1)[1].strip()
-            parsed = _json.loads(data_str)
+            parsed = _json.loads(fields["data"].strip())
             assert isinstance(parsed, dict), f"SSE data must be a JSON object, got: {type(parsed)}"
+
+    @patch("pocketpaw.api.v1.chat._send_message")
+    @patch("pocketpaw.api.v1.chat._APISessionBridge")
+    def test_sse_data_is_utf8_not_escaped(self, mock_bridge_cls, mock_send, client):
+        """Non-ASCII content is sent as raw UTF-8 rather than \\u escapes."""
+        bridge = MagicMock()
+        bridge.start = AsyncMock()
+        bridge.stop = AsyncMock()
+        mock_bridge_cls.return_value = bridge
+        mock_send.return_value = "api:utf8-test"
+
+        bridge.queue = _EventQueue(
+            {"event": "chunk", "data": {"content": "héllo 🐾"}},
+            {"event": "stream_end", "data": {"session_id": "api:utf8-test", "usage": {}}},
+        )
+
+        with client.stream("POST", "/api/v1/chat/stream", json={"content": "test"}) as resp:
+            raw = resp.read().decode()
+
+        assert "héllo 🐾" in raw
+        assert "\\u" not in raw
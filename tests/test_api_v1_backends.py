@@ -3,28 +3,31 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from pocketpaw.api.v1.backends import router
 
 
-def _test_app():
+@pytest.fixture(scope="module")
+def test_app():
     app = FastAPI()
     app.include_router(router, prefix="/api/v1")
     return app
 
 
-def _client():
-    return TestClient(_test_app())
+@pytest.fixture(scope="module")
+def client(test_app):
+    with TestClient(test_app) as c:
+        yield c
 
 
 class TestListBackends:
     """Tests for GET /backends."""
 
     @patch("pocketpaw.api.v1.backends._check_available", return_value=True)
-    def test_list_returns_array(self, _mock_check):
-        client = _client()
+    def test_list_returns_array(self, _mock_check, client):
         resp = client.get("/api/v1/backends")
         assert resp.status_code == 200
         data = resp.json()
@@ -32,8 +35,7 @@ class TestListBackends:
         assert len(data) > 0
 
     @patch("pocketpaw.api.v1.backends._check_available", return_value=True)
-    def test_backend_has_required_fields(self, _mock_check):
-        client = _client()
+    def test_backend_has_required_fields(self, _mock_check, client):
         resp = client.get("/api/v1/backends")
         for backend in resp.json():
             assert "name" in backend
@@ -43,8 +45,7 @@ class TestListBackends:
             assert isinstance(backend["capabilities"], list)
 
     @patch("pocketpaw.api.v1.backends._check_available", return_value=False)
-    def test_unavailable_backend(self, _mock_check):
-        client = _client()
+    def test_unavailable_backend(self, _mock_check, client):
         resp = client.get("/api/v1/backends")
         data = resp.json()
         # At least some backends should show as unavailable
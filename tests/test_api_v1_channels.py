@@ -11,30 +11,35 @@ import pocketpaw.dashboard  # noqa: F401 — force module-level side effects
 from pocketpaw.api.v1.channels import router
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_app():
     app = FastAPI()
     app.include_router(router, prefix="/api/v1")
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(test_app):
-    return TestClient(test_app)
+    with TestClient(test_app) as c:
+        yield c
+
+
+@pytest.fixture
+def patched_dashboard(monkeypatch):
+    """Report every channel as unconfigured/stopped and return the mock settings."""
+    monkeypatch.setattr("pocketpaw.dashboard_state._channel_autostart_enabled", lambda *_: False)
+    monkeypatch.setattr("pocketpaw.dashboard_state._channel_is_running", lambda *_: False)
+    monkeypatch.setattr("pocketpaw.dashboard_state._channel_is_configured", lambda *_: False)
+    settings = MagicMock(whatsapp_mode="business")
+    monkeypatch.setattr("pocketpaw.config.Settings.load", lambda: settings)
+    return settings
 
 
 class TestChannelsStatus:
     """Tests for GET /channels/status."""
 
-    def test_returns_all_channels(self, client):
-        mock_settings = MagicMock(whatsapp_mode="business")
-        with (
-            patch("pocketpaw.dashboard_state._channel_autostart_enabled", return_value=False),
-            patch("pocketpaw.dashboard_state._channel_is_running", return_value=False),
-            patch("pocketpaw.dashboard_state._channel_is_configured", return_value=False),
-            patch("pocketpaw.config.Settings.load", return_value=mock_settings),
-        ):
-            resp = client.get("/api/v1/channels/status")
+    def test_returns_all_channels(self, client, patched_dashboard):
+        resp = client.get("/api/v1/channels/status")
         assert resp.status_code == 200
         data = resp.json()
         expected_channels = {
@@ -43,30 +48,17 @@ class TestChannelsStatus:
         }
         assert set(data.keys()) == expected_channels
 
-    def test_channel_has_status_fields(self, client):
-        mock_settings = MagicMock(whatsapp_mode="business")
-        with (
-            patch("pocketpaw.dashboard_state._channel_autostart_enabled", return_value=False),
-            patch("pocketpaw.dashboard_state._channel_is_running", return_value=False),
-            patch("pocketpaw.dashboard_state._channel_is_configured", return_value=False),
-            patch("pocketpaw.config.Settings.load", return_value=mock_settings),
-        ):
-            resp = client.get("/api/v1/channels/status")
+    def test_channel_has_status_fields(self, client, patched_dashboard):
+        resp = client.get("/api/v1/channels/status")
         data = resp.json()
         for ch, status in data.items():
             assert "configured" in status
             assert "running" in status
             assert "autostart" in status
 
-    def test_whatsapp_has_mode(self, client):
-        mock_settings = MagicMock(whatsapp_mode="personal")
-        with (
-            patch("pocketpaw.dashboard_state._channel_autostart_enabled", return_value=False),
-            patch("pocketpaw.dashboard_state._channel_is_running", return_value=False),
-            patch("pocketpaw.dashboard_state._channel_is_configured", return_value=False),
-            patch("pocketpaw.config.Settings.load", return_value=mock_settings),
-        ):
-            resp = client.get("/api/v1/channels/status")
+    def test_whatsapp_has_mode(self, client, patched_dashboard):
+        patched_dashboard.whatsapp_mode = "personal"
+        resp = client.get("/api/v1/channels/status")
         assert resp.json()["whatsapp"]["mode"] == "personal"
 
 
@@ -108,24 +100,18 @@ class TestToggleChannel:
         )
         assert resp.status_code == 400
 
-    def test_start_already_running(self, client):
+    def test_start_already_running(self, client, monkeypatch):
         # The channels router does `from pocketpaw.dashboard import _channel_is_running`
         # inside the function body, so we must patch on the dashboard module.
         import pocketpaw.dashboard as _dash
 
-        orig_running = _dash._channel_is_running
-        orig_keys = _dash._CHANNEL_CONFIG_KEYS
-        _dash._channel_is_running = lambda ch: True
-        _dash._CHANNEL_CONFIG_KEYS = {"discord": {}}
-        try:
-            with patch("pocketpaw.config.Settings.load", return_value=MagicMock()):
-                resp = client.post(
-                    "/api/v1/channels/toggle",
-                    json={"channel": "discord", "action": "start"},
-                )
-        finally:
-            _dash._channel_is_running = orig_running
-            _dash._CHANNEL_CONFIG_KEYS = orig_keys
+        monkeypatch.setattr(_dash, "_channel_is_running", lambda ch: True)
+        monkeypatch.setattr(_dash, "_CHANNEL_CONFIG_KEYS", {"discord": {}})
+        with patch("pocketpaw.config.Settings.load", return_value=MagicMock()):
+            resp = client.post(
+                "/api/v1/channels/toggle",
+                json={"channel": "discord", "action": "start"},
+            )
         assert resp.status_code == 200
         assert "already running" in resp.json().get("error", "")
 
@@ -144,29 +130,21 @@ class TestToggleChannel:
 class TestExtrasCheck:
     """Tests for GET /extras/check."""
 
-    def test_check_installed(self, client):
+    def test_check_installed(self, client, monkeypatch):
         import pocketpaw.dashboard as _dash
 
-        orig_deps = _dash._CHANNEL_DEPS
-        orig_importable = _dash._is_module_importable
-        _dash._CHANNEL_DEPS = {"discord": ("discord", "discord.py", "discord.py>=2.0")}
-        _dash._is_module_importable = lambda mod: True
-        try:
-            resp = client.get("/api/v1/extras/check?channel=discord")
-        finally:
-            _dash._CHANNEL_DEPS = orig_deps
-            _dash._is_module_importable = orig_importable
+        monkeypatch.setattr(
+            _dash, "_CHANNEL_DEPS", {"discord": ("discord", "discord.py", "discord.py>=2.0")}
+        )
+        monkeypatch.setattr(_dash, "_is_module_importable", lambda mod: True)
+        resp = client.get("/api/v1/extras/check?channel=discord")
         assert resp.status_code == 200
         assert resp.json()["installed"] is True
 
-    def test_check_no_deps_needed(self, client):
+    def test_check_no_deps_needed(self, client, monkeypatch):
         import pocketpaw.dashboard as _dash
 
-        orig = _dash._CHANNEL_DEPS
-        _dash._CHANNEL_DEPS = {}
-        try:
-            resp = client.get("/api/v1/extras/check?channel=telegram")
-        finally:
-            _dash._CHANNEL_DEPS = orig
+        monkeypatch.setattr(_dash, "_CHANNEL_DEPS", {})
+        resp = client.get("/api/v1/extras/check?channel=telegram")
         assert resp.status_code == 200
         assert resp.json()["installed"] is True
@@ -10,16 +10,30 @@ from fastapi.testclient import TestClient
 from pocketpaw.api.v1.mcp import router
 
 
-@pytest.fixture
+class _AddManager:
+    """MCP manager stand-in that records added configs and starts cleanly."""
+
+    def __init__(self):
+        self.configs = []
+
+    def add_server_config(self, config):
+        self.configs.append(config)
+
+    async def start_server(self, config):
+        return True
+
+
+@pytest.fixture(scope="module")
 def test_app():
     app = FastAPI()
     app.include_router(router, prefix="/api/v1")
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(test_app):
-    return TestClient(test_app)
+    with TestClient(test_app) as c:
+        yield c
 
 
 class TestMCPStatus:
@@ -43,15 +57,14 @@ class TestMCPAdd:
 
     @patch("pocketpaw.mcp.manager.get_mcp_manager")
     def test_add_server(self, mock_get_mgr, client):
-        mgr = MagicMock()
-        mgr.start_server = AsyncMock(return_value=True)
+        mgr = _AddManager()
         mock_get_mgr.return_value = mgr
         resp = client.post(
             "/api/v1/mcp/add",
             json={"name": "test", "transport": "stdio", "command": "npx", "args": ["-y", "test"]},
         )
         assert resp.status_code == 200
-        mgr.add_server_config.assert_called_once()
+        assert len(mgr.configs) == 1
 
     def test_add_server_missing_name(self, client):
         resp = client.post(
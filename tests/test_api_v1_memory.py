@@ -10,16 +10,43 @@ from fastapi.testclient import TestClient
 from pocketpaw.api.v1.memory import router
 
 
-@pytest.fixture
+class _BareStore:
+    """Store with no optional methods (e.g. no get_memory_stats)."""
+
+    __slots__ = ()
+
+
+class _LongTermStore:
+    """Store that only serves get_by_type()."""
+
+    def __init__(self, items):
+        self.items = items
+
+    async def get_by_type(self, memory_type, limit=50):
+        return self.items
+
+
+class _DeleteStore:
+    """Store that only serves delete()."""
+
+    def __init__(self, deleted):
+        self.deleted = deleted
+
+    async def delete(self, entry_id):
+        return self.deleted
+
+
+@pytest.fixture(scope="module")
 def test_app():
     app = FastAPI()
     app.include_router(router, prefix="/api/v1")
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(test_app):
-    return TestClient(test_app)
+    with TestClient(test_app) as c:
+        yield c
 
 
 class TestMemorySettings:
@@ -69,10 +96,8 @@ class TestMemoryLongTerm:
         item.content = "Test memory"
         item.created_at = "2026-02-21T00:00:00"
         item.tags = ["test"]
-        store = AsyncMock()
-        store.get_by_type.return_value = [item]
         mgr = MagicMock()
-        mgr._store = store
+        mgr._store = _LongTermStore([item])
         mock_get_mgr.return_value = mgr
 
         resp = client.get("/api/v1/memory/long_term")
@@ -94,20 +119,16 @@ class TestMemoryLongTerm:
 
     @patch("pocketpaw.memory.get_memory_manager")
     def test_delete_memory_entry(self, mock_get_mgr, client):
-        store = AsyncMock()
-        store.delete.return_value = True
         mgr = MagicMock()
-        mgr._store = store
+        mgr._store = _DeleteStore(True)
         mock_get_mgr.return_value = mgr
         resp = client.delete("/api/v1/memory/long_term/mem-1")
         assert resp.status_code == 200
 
     @patch("pocketpaw.memory.get_memory_manager")
     def test_delete_nonexistent_entry(self, mock_get_mgr, client):
-        store = AsyncMock()
-        store.delete.return_value = False
         mgr = MagicMock()
-        mgr._store = store
+        mgr._store = _DeleteStore(False)
         mock_get_mgr.return_value = mgr
         resp = client.delete("/api/v1/memory/long_term/nope")
         assert resp.status_code == 404
@@ -118,9 +139,8 @@ class TestMemoryStats:
 
     @patch("pocketpaw.memory.get_memory_manager")
     def test_file_store_stats(self, mock_get_mgr, client):
-        store = MagicMock(spec=[])  # No get_memory_stats attr
         mgr = MagicMock()
-        mgr._store = store
+        mgr._store = _BareStore()
         mock_get_mgr.return_value = mgr
         resp = client.get("/api/v1/memory/stats")
         assert resp.status_code == 200
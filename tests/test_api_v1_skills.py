@@ -10,16 +10,17 @@ from fastapi.testclient import TestClient
 from pocketpaw.api.v1.skills import router
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_app():
     app = FastAPI()
     app.include_router(router, prefix="/api/v1")
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(test_app):
-    return TestClient(test_app)
+    with TestClient(test_app) as c:
+        yield c
 
 
 class TestListSkills:
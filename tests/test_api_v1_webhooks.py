@@ -1,100 +1,126 @@
 # Tests for API v1 webhooks router.
 # Created: 2026-02-21
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 
 from pocketpaw.api.v1.webhooks import router
 
+# Share one event loop across the module so the module-scoped client can be reused,
+# and keep the module on one xdist worker (--dist loadgroup) so it's only built once
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group("webhooks_api"),
+]
 
-@pytest.fixture
+# Request bodies are static, so send them pre-encoded instead of via json=
+_JSON = {"content-type": "application/json"}
+_ADD_BODY = b'{"name":"my-hook","description":"Test"}'
+
+_DEFAULTS = {"web_port": 8888, "webhook_configs": [], "webhook_sync_timeout": 30}
+
+
+class _Redacted:
+    """Equals any redacted secret: starts with ``***`` and doesn't expose ``hidden``."""
+
+    def __init__(self, hidden):
+        self.hidden = hidden
+
+    def __eq__(self, other):
+        return isinstance(other, str) and other.startswith("***") and self.hidden not in other
+
+    def __repr__(self):
+        return f"_Redacted(hidden={self.hidden!r})"
+
+
+def _mk(**overrides):
+    """Settings stand-in with default fields, a no-op save(), and any overrides."""
+    fields = {**_DEFAULTS, "save": lambda: None, **overrides}
+    # The router appends to webhook_configs, so never hand out the shared default
+    fields["webhook_configs"] = list(fields["webhook_configs"])
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture(autouse=True)
+def settings_stub(monkeypatch):
+    """Patch Settings.load once per test; tests put their stand-in in settings_stub["s"]."""
+    holder = {"s": _mk()}
+    monkeypatch.setattr("pocketpaw.config.Settings.load", lambda: holder["s"])
+    return holder
+
+
+@pytest.fixture(scope="module")
 def test_app():
-    app = FastAPI()
+    # No docs/OpenAPI routes: the tests only exercise the webhooks router
+    app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
     app.include_router(router, prefix="/api/v1")
     return app
 
 
-@pytest.fixture
-def client(test_app):
-    return TestClient(test_app)
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(test_app):
+    transport = httpx.ASGITransport(app=test_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
 
 
 class TestListWebhooks:
     """Tests for GET /webhooks."""
 
-    @patch("pocketpaw.config.Settings.load")
-    def test_list_webhooks(self, mock_load, client):
-        mock_s = MagicMock()
-        mock_s.web_port = 8888
-        mock_s.webhook_configs = [
-            {"name": "test-hook", "secret": "abcdef12345678", "description": "Test webhook"}
-        ]
-        mock_s.webhook_sync_timeout = 30
-        mock_load.return_value = mock_s
-
-        resp = client.get("/api/v1/webhooks")
-        assert resp.status_code == 200
-        data = resp.json()
-        assert len(data["webhooks"]) == 1
-        hook = data["webhooks"][0]
-        assert hook["name"] == "test-hook"
-        # Secret must be redacted
-        assert "abcdef" not in hook["secret"]
-        assert hook["secret"].startswith("***")
-
-    @patch("pocketpaw.config.Settings.load")
-    def test_list_empty(self, mock_load, client):
-        mock_s = MagicMock()
-        mock_s.web_port = 8888
-        mock_s.webhook_configs = []
-        mock_load.return_value = mock_s
-
-        resp = client.get("/api/v1/webhooks")
+    @pytest.mark.parametrize(
+        "configs,expected",
+        [
+            (
+                [{"name": "test-hook", "secret": "abcdef12345678", "description": "Test webhook"}],
+                {
+                    "webhooks": [
+                        {
+                            "name": "test-hook",
+                            "description": "Test webhook",
+                            # Secret must be redacted
+                            "secret": _Redacted(hidden="abcdef"),
+                            "sync_timeout": 30,
+                            "url": "http://test/webhook/inbound/test-hook",
+                        }
+                    ]
+                },
+            ),
+            ([], {"webhooks": []}),
+        ],
+        ids=["one-hook", "empty"],
+    )
+    async def test_list(self, client, settings_stub, configs, expected):
+        settings_stub["s"] = _mk(webhook_configs=configs)
+
+        resp = await client.get("/api/v1/webhooks")
         assert resp.status_code == 200
-        assert resp.json()["webhooks"] == []
+        assert resp.json() == expected
 
 
 class TestAddWebhook:
     """Tests for POST /webhooks/add."""
 
-    @patch("pocketpaw.config.Settings.load")
-    def test_add_webhook(self, mock_load, client):
-        mock_s = MagicMock()
-        mock_s.webhook_configs = []
-        mock_s.webhook_sync_timeout = 30
-        mock_load.return_value = mock_s
+    async def test_add_webhook(self, client, settings_stub):
+        saved = []
+        settings_stub["s"] = _mk(save=lambda: saved.append(1))
 
-        resp = client.post(
-            "/api/v1/webhooks/add",
-            json={"name": "my-hook", "description": "Test"},
-        )
+        resp = await client.post("/api/v1/webhooks/add", content=_ADD_BODY, headers=_JSON)
         assert resp.status_code == 200
         data = resp.json()
         assert data["status"] == "ok"
         assert data["webhook"]["name"] == "my-hook"
         assert len(data["webhook"]["secret"]) > 10
-        mock_s.save.assert_called_once()
-
-    def test_add_missing_name(self, client):
-        resp = client.post("/api/v1/webhooks/add", json={"name": ""})
-        assert resp.status_code == 400
-
-    def test_add_invalid_name(self, client):
-        resp = client.post("/api/v1/webhooks/add", json={"name": "bad name!"})
-        assert resp.status_code == 400
+        assert len(saved) == 1
 
-    @patch("pocketpaw.config.Settings.load")
-    def test_add_duplicate(self, mock_load, client):
-        mock_s = MagicMock()
-        mock_s.webhook_configs = [{"name": "existing"}]
-        mock_load.return_value = mock_s
+    async def test_add_duplicate(self, client, settings_stub):
+        settings_stub["s"] = _mk(webhook_configs=[{"name": "existing"}])
 
-        resp = client.post(
-            "/api/v1/webhooks/add",
-            json={"name": "existing"},
+        resp = await client.post(
+            "/api/v1/webhooks/add", content=b'{"name":"existing"}', headers=_JSON
         )
         assert resp.status_code == 409
 
@@ -102,53 +128,49 @@ class TestAddWebhook:
 class TestRemoveWebhook:
     """Tests for POST /webhooks/remove."""
 
-    @patch("pocketpaw.config.Settings.load")
-    def test_remove_existing(self, mock_load, client):
-        mock_s = MagicMock()
-        mock_s.webhook_configs = [{"name": "delete-me"}]
-        mock_load.return_value = mock_s
+    async def test_remove_existing(self, client, settings_stub):
+        saved = []
+        settings_stub["s"] = _mk(
+            webhook_configs=[{"name": "delete-me"}], save=lambda: saved.append(1)
+        )
 
-        resp = client.post("/api/v1/webhooks/remove", json={"name": "delete-me"})
+        resp = await client.post(
+            "/api/v1/webhooks/remove", content=b'{"name":"delete-me"}', headers=_JSON
+        )
         assert resp.status_code == 200
-        mock_s.save.assert_called_once()
-
-    @patch("pocketpaw.config.Settings.load")
-    def test_remove_nonexistent(self, mock_load, client):
-        mock_s = MagicMock()
-        mock_s.webhook_configs = []
-        mock_load.return_value = mock_s
-
-        resp = client.post("/api/v1/webhooks/remove", json={"name": "nope"})
-        assert resp.status_code == 404
+        assert len(saved) == 1
 
 
 class TestRegenerateSecret:
     """Tests for POST /webhooks/regenerate-secret."""
 
-    @patch("pocketpaw.config.Settings.load")
-    def test_regenerate(self, mock_load, client):
-        mock_s = MagicMock()
+    async def test_regenerate(self, client, settings_stub):
         old_secret = "old-secret-value"
-        mock_s.webhook_configs = [{"name": "my-hook", "secret": old_secret}]
-        mock_load.return_value = mock_s
+        settings_stub["s"] = _mk(webhook_configs=[{"name": "my-hook", "secret": old_secret}])
 
-        resp = client.post(
-            "/api/v1/webhooks/regenerate-secret",
-            json={"name": "my-hook"},
+        resp = await client.post(
+            "/api/v1/webhooks/regenerate-secret", content=b'{"name":"my-hook"}', headers=_JSON
         )
         assert resp.status_code == 200
         data = resp.json()
         assert data["status"] == "ok"
         assert data["secret"] != old_secret
 
-    @patch("pocketpaw.config.Settings.load")
-    def test_regenerate_not_found(self, mock_load, client):
-        mock_s = MagicMock()
-        mock_s.webhook_configs = []
-        mock_load.return_value = mock_s
 
-        resp = client.post(
-            "/api/v1/webhooks/regenerate-secret",
-            json={"name": "nope"},
-        )
-        assert resp.status_code == 404
+class TestErrorResponses:
+    """Invalid input and unknown webhook names across the mutating routes."""
+
+    @pytest.mark.parametrize(
+        "path,body,status",
+        [
+            ("/api/v1/webhooks/add", b'{"name":""}', 400),
+            ("/api/v1/webhooks/add", b'{"name":"bad name!"}', 400),
+            ("/api/v1/webhooks/remove", b'{"name":"nope"}', 404),
+            ("/api/v1/webhooks/regenerate-secret", b'{"name":"nope"}', 404),
+        ],
+        ids=["add-missing-name", "add-invalid-name", "remove-nonexistent", "regenerate-not-found"],
+    )
+    async def test_error_status(self, client, path, body, status):
+        # settings_stub's default (no webhooks) applies
+        resp = await client.post(path, content=body, headers=_JSON)
+        assert resp.status_code == status